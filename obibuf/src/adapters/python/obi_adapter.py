@@ -4,9 +4,62 @@ Thin serialization layer with Zero Trust enforcement
 """
 
 import ctypes
-import json
-from typing import Optional, Dict, Any
-from pathlib import Path
+import functools
+import os
+import queue
+from typing import Optional, Dict, Any, Union
+
+import orjson
+
+try:
+    import msgspec
+except ImportError:  # typed messages unavailable - dicts only
+    msgspec = None
+
+
+if msgspec is not None:
+    class OBIMessage(msgspec.Struct, frozen=True):
+        """
+        Base for typed messages with a known schema.
+        Encoded with sorted field names, matching the dict encoding,
+        except that nested dicts need str keys and integers wider than
+        64 bits are accepted.
+        """
+else:
+    def __getattr__(name: str) -> Any:
+        """Explain a missing OBIMessage instead of a bare AttributeError."""
+        if name == "OBIMessage":
+            raise ImportError("OBIMessage requires msgspec - pip install msgspec")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _canonical_dumps(obj: Any) -> bytes:
+    """
+    Encode obj as compact, key-sorted UTF-8 JSON.
+    Integers outside the 64-bit range raise ValueError.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as e:
+        raise ValueError(f"Invalid message: {e}") from e
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_library_path() -> str:
+    """Search standard locations for the core library once per process."""
+    possible_paths = [
+        "./libobi_buffer_core.so",
+        "/usr/local/lib/libobi_buffer_core.so",
+        "../build/libobi_buffer_core.so"
+    ]
+    
+    for path in possible_paths:
+        if os.path.exists(path):
+            # Absolute so a later chdir cannot change what gets loaded
+            return os.path.abspath(path)
+    
+    raise FileNotFoundError("OBI Buffer core library not found")
+
 
 class OBIBufferAdapter:
     """
@@ -23,6 +76,9 @@ class OBIBufferAdapter:
         self._lib = ctypes.CDLL(library_path)
         self._setup_function_signatures()
         
+        # Idle buffer handles reused across serialize calls
+        self._buffer_pool = queue.SimpleQueue()
+        
         # Initialize OBI Buffer library
         result = self._lib.obi_init()
         if result != 0:
@@ -30,17 +86,7 @@ class OBIBufferAdapter:
     
     def _find_library(self) -> str:
         """Locate OBI Buffer core library."""
-        possible_paths = [
-            "./libobi_buffer_core.so",
-            "/usr/local/lib/libobi_buffer_core.so",
-            "../build/libobi_buffer_core.so"
-        ]
-        
-        for path in possible_paths:
-            if Path(path).exists():
-                return path
-        
-        raise FileNotFoundError("OBI Buffer core library not found")
+        return _resolved_library_path()
     
     def _setup_function_signatures(self):
         """Setup C function signatures for type safety."""
@@ -51,32 +97,50 @@ class OBIBufferAdapter:
         self._lib.obi_buffer_destroy.argtypes = [ctypes.c_void_p]
         self._lib.obi_buffer_destroy.restype = ctypes.c_int
         
+        self._lib.obi_buffer_set_data.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
+        self._lib.obi_buffer_set_data.restype = ctypes.c_int
+        
         # Validation
         self._lib.obi_validate_buffer.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
         self._lib.obi_validate_buffer.restype = ctypes.c_int
     
-    def serialize_message(self, message_dict: Dict[str, Any]) -> bytes:
+    def _acquire_buffer(self) -> ctypes.c_void_p:
         """
-        Serialize Python dict to OBI Buffer format.
-        THIN LAYER: No business logic, only format conversion.
+        Take an idle buffer handle from the pool, creating one if none is free.
+        Pooled handles only ever receive set_data - this adapter never
+        validates or normalizes them, so no C-side flags carry over.
         """
-        # Convert to canonical JSON (normalized)
-        canonical_json = json.dumps(message_dict, sort_keys=True, separators=(',', ':'))
+        try:
+            return self._buffer_pool.get_nowait()
+        except queue.Empty:
+            pass
         
-        # Create buffer and validate through C core
         buffer_ptr = ctypes.c_void_p()
         result = self._lib.obi_buffer_create(ctypes.byref(buffer_ptr))
         if result != 0:
             raise RuntimeError(f"Buffer creation failed: {result}")
+        return buffer_ptr
+    
+    def serialize_message(self, message: Union[Dict[str, Any], "msgspec.Struct"]) -> bytes:
+        """
+        Serialize Python dict or msgspec.Struct to OBI Buffer format.
+        THIN LAYER: No business logic, only format conversion.
+        """
+        # Convert to canonical JSON (normalized)
+        if msgspec is not None and isinstance(message, msgspec.Struct):
+            try:
+                data_bytes = msgspec.json.encode(message, order="sorted")
+            except (TypeError, msgspec.EncodeError) as e:
+                raise ValueError(f"Invalid message: {e}") from e
+        else:
+            data_bytes = _canonical_dumps(message)
+        
+        # Take a pooled buffer and validate through C core
+        buffer_ptr = self._acquire_buffer()
         
         try:
             # Set buffer data
-            data_bytes = canonical_json.encode('utf-8')
-            result = self._lib.obi_buffer_set_data(
-                buffer_ptr, 
-                ctypes.c_char_p(data_bytes), 
-                len(data_bytes)
-            )
+            result = self._lib.obi_buffer_set_data(buffer_ptr, data_bytes, len(data_bytes))
             if result != 0:
                 raise RuntimeError(f"Buffer data setting failed: {result}")
             
@@ -84,7 +148,7 @@ class OBIBufferAdapter:
             return data_bytes
             
         finally:
-            self._lib.obi_buffer_destroy(buffer_ptr)
+            self._buffer_pool.put(buffer_ptr)
     
     def deserialize_message(self, buffer_data: bytes) -> Dict[str, Any]:
         """
@@ -93,12 +157,17 @@ class OBIBufferAdapter:
         """
         try:
             # Parse canonical JSON
-            canonical_str = buffer_data.decode('utf-8')
-            return json.loads(canonical_str)
-        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            return orjson.loads(buffer_data)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid buffer format: {e}")
     
     def __del__(self):
         """Cleanup C library resources."""
+        if hasattr(self, '_buffer_pool'):
+            while True:
+                try:
+                    self._lib.obi_buffer_destroy(self._buffer_pool.get_nowait())
+                except queue.Empty:
+                    break
         if hasattr(self, '_lib'):
             self._lib.obi_cleanup()
@@ -9,28 +9,33 @@ No direct Python serialization permitted - enforces canonical protocol
 
 import ctypes
 import ctypes.util
+import functools
 import os
 import sys
-from typing import Optional, Union, Dict, Any
-from dataclasses import dataclass
+import threading
+from typing import Optional, Union, Dict, Any, List
 from enum import IntEnum
 import hashlib
 import time
 
+import orjson
+
 # Load the core C library
-def _load_obiprotocol_library():
-    """Load libobiprotocol with proper error handling"""
+def _library_candidates() -> tuple:
+    """Absolute paths of libobiprotocol builds present"""
     library_paths = [
         "build/release/libobiprotocol.so",
         "build/debug/libobiprotocol.so", 
         "/usr/local/lib/libobiprotocol.so",
         "libobiprotocol.so"
     ]
-    
-    for path in library_paths:
+    return tuple(os.path.abspath(path) for path in library_paths if os.path.exists(path))
+
+def _load_obiprotocol_library():
+    """Load libobiprotocol with proper error handling"""
+    for path in _library_candidates():
         try:
-            if os.path.exists(path):
-                return ctypes.CDLL(path)
+            return ctypes.CDLL(path)
         except OSError:
             continue
     
@@ -66,6 +71,9 @@ class OBIResult(IntEnum):
     ERROR_NUMERICAL_INSTABILITY = -6
     ERROR_SINPHASE_VIOLATION = -7
 
+# Plain int for hot-path result checks - skips enum member lookup
+_SUCCESS = int(OBIResult.SUCCESS)
+
 class SecurityLevel(IntEnum):
     """Security levels matching C enum"""
     STANDARD = 0
@@ -78,14 +86,47 @@ class GovernanceZone(IntEnum):
     WARNING = 1       # 0.5 < C ≤ 0.6  
     GOVERNANCE = 2    # C > 0.6
 
-@dataclass
-class ValidationContext:
-    """Validation context for Zero Trust enforcement"""
-    zero_trust_enforced: bool = True
-    canonical_only: bool = True
-    alpha: float = OBI_ALPHA_DEFAULT
-    beta: float = OBI_BETA_DEFAULT
-    epsilon_min: float = 1e-12
+class ValidationContext(ctypes.Structure):
+    """
+    Validation context for Zero Trust enforcement
+    
+    Laid out as the C validation context so it is passed to the core as-is
+    """
+    _fields_ = [
+        ("zero_trust_enforced", ctypes.c_bool),
+        ("canonical_only", ctypes.c_bool),
+        ("alpha", ctypes.c_double),
+        ("beta", ctypes.c_double),
+        ("epsilon_min", ctypes.c_double)
+    ]
+    
+    def __init__(self, zero_trust_enforced: bool = True, canonical_only: bool = True,
+                 alpha: float = OBI_ALPHA_DEFAULT, beta: float = OBI_BETA_DEFAULT,
+                 epsilon_min: float = 1e-12):
+        super().__init__(zero_trust_enforced, canonical_only, alpha, beta, epsilon_min)
+    
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name, _ in self._fields_)
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name, _ in self._fields_)
+        return f"{self.__class__.__name__}({fields})"
+
+# Default messages per result code, built once at import
+_RESULT_MESSAGES: Dict[int, str] = {
+    OBIResult.ERROR_INVALID_INPUT: "Invalid input provided",
+    OBIResult.ERROR_VALIDATION_FAILED: "Buffer validation failed",
+    OBIResult.ERROR_AUDIT_REQUIRED: "Audit trail required",
+    OBIResult.ERROR_ZERO_TRUST_VIOLATION: "Zero Trust architecture violation",
+    OBIResult.ERROR_BUFFER_OVERFLOW: "Buffer size exceeded",
+    OBIResult.ERROR_NUMERICAL_INSTABILITY: "Mathematical computation unstable",
+    OBIResult.ERROR_SINPHASE_VIOLATION: "Sinphasé governance violation"
+}
 
 class OBIException(Exception):
     """Base exception for OBI protocol errors"""
@@ -95,16 +136,11 @@ class OBIException(Exception):
         super().__init__(self.message)
     
     def _get_result_message(self, result: OBIResult) -> str:
-        messages = {
-            OBIResult.ERROR_INVALID_INPUT: "Invalid input provided",
-            OBIResult.ERROR_VALIDATION_FAILED: "Buffer validation failed",
-            OBIResult.ERROR_AUDIT_REQUIRED: "Audit trail required",
-            OBIResult.ERROR_ZERO_TRUST_VIOLATION: "Zero Trust architecture violation",
-            OBIResult.ERROR_BUFFER_OVERFLOW: "Buffer size exceeded",
-            OBIResult.ERROR_NUMERICAL_INSTABILITY: "Mathematical computation unstable",
-            OBIResult.ERROR_SINPHASE_VIOLATION: "Sinphasé governance violation"
-        }
-        return messages.get(result, f"Unknown error: {result}")
+        message = _RESULT_MESSAGES.get(result)
+        if message is None:
+            # Only format the fallback for codes outside the table
+            return f"Unknown error: {result}"
+        return message
 
 # C structure definitions using ctypes
 class _CBuffer(ctypes.Structure):
@@ -120,16 +156,6 @@ class _CBuffer(ctypes.Structure):
         ("governance_zone", ctypes.c_int)
     ]
 
-class _CValidationContext(ctypes.Structure):
-    """C validation context structure"""
-    _fields_ = [
-        ("zero_trust_enforced", ctypes.c_bool),
-        ("canonical_only", ctypes.c_bool),
-        ("alpha", ctypes.c_double),
-        ("beta", ctypes.c_double),
-        ("epsilon_min", ctypes.c_double)
-    ]
-
 # Function signatures
 _lib.obi_init.restype = ctypes.c_int
 _lib.obi_cleanup.restype = None
@@ -140,10 +166,10 @@ _lib.obi_buffer_create.restype = ctypes.c_int
 _lib.obi_buffer_destroy.argtypes = [ctypes.c_void_p]
 _lib.obi_buffer_destroy.restype = ctypes.c_int
 
-_lib.obi_buffer_set_data.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t]
+_lib.obi_buffer_set_data.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
 _lib.obi_buffer_set_data.restype = ctypes.c_int
 
-_lib.obi_validator_create.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(_CValidationContext)]
+_lib.obi_validator_create.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ValidationContext)]
 _lib.obi_validator_create.restype = ctypes.c_int
 
 _lib.obi_validator_destroy.argtypes = [ctypes.c_void_p]
@@ -165,8 +191,10 @@ class OBIBuffer:
     def __init__(self):
         self._handle = ctypes.c_void_p()
         result = _lib.obi_buffer_create(ctypes.byref(self._handle))
-        if result != OBIResult.SUCCESS:
+        if result != _SUCCESS:
             raise OBIException(OBIResult(result))
+        # Raw address for hot-path calls - c_void_p argtypes accept a plain int
+        self._handle_val = self._handle.value
         
         self._validated = False
         self._normalized = False
@@ -191,11 +219,12 @@ class OBIBuffer:
         if len(data) > OBI_MAX_BUFFER_SIZE:
             raise OBIException(OBIResult.ERROR_BUFFER_OVERFLOW)
         
-        # Convert to ctypes array
-        data_array = (ctypes.c_uint8 * len(data))(*data)
+        # bytes pass through c_char_p as-is; bytearrays are aliased, not copied
+        if isinstance(data, bytearray):
+            data = (ctypes.c_char * len(data)).from_buffer(data)
         
-        result = _lib.obi_buffer_set_data(self._handle, data_array, len(data))
-        if result != OBIResult.SUCCESS:
+        result = _lib.obi_buffer_set_data(self._handle_val, data, len(data))
+        if result != _SUCCESS:
             raise OBIException(OBIResult(result))
     
     @property
@@ -229,19 +258,11 @@ class OBIValidator:
             raise OBIException(OBIResult.ERROR_ZERO_TRUST_VIOLATION,
                              "Cannot disable Zero Trust enforcement in adapter")
         
-        # Convert to C structure
-        c_context = _CValidationContext(
-            zero_trust_enforced=context.zero_trust_enforced,
-            canonical_only=context.canonical_only,
-            alpha=context.alpha,
-            beta=context.beta,
-            epsilon_min=context.epsilon_min
-        )
-        
         self._handle = ctypes.c_void_p()
-        result = _lib.obi_validator_create(ctypes.byref(self._handle), ctypes.byref(c_context))
-        if result != OBIResult.SUCCESS:
+        result = _lib.obi_validator_create(ctypes.byref(self._handle), ctypes.byref(context))
+        if result != _SUCCESS:
             raise OBIException(OBIResult(result))
+        self._handle_val = self._handle.value
     
     def __del__(self):
         if hasattr(self, '_handle') and self._handle:
@@ -253,14 +274,31 @@ class OBIValidator:
         
         Returns True if validation succeeds, raises exception on failure
         """
-        result = _lib.obi_validate_buffer(self._handle, buffer._handle)
+        result = _lib.obi_validate_buffer(self._handle_val, buffer._handle_val)
         
-        if result == OBIResult.SUCCESS:
+        if result == _SUCCESS:
             buffer._validated = True
             return True
         else:
             raise OBIException(OBIResult(result))
 
+def _canonical_bytes(data: Any) -> bytes:
+    """
+    Convert data to canonical bytes (simple serialization)
+    
+    Non-str dict keys are stringified as json.dumps does; integers
+    must fit in 64 bits
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        # Already serialized - treated as canonical and validated as-is
+        return bytes(data)
+    if isinstance(data, (dict, list)):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            raise ValueError(f"Serialization failed: {e}") from e
+    return str(data).encode('utf-8')
+
 class OBIProtocol:
     """
     Main interface for OBI Buffer Protocol
@@ -269,6 +307,7 @@ class OBIProtocol:
     """
     
     _initialized = False
+    _init_lock = threading.Lock()
     
     @classmethod
     def initialize(cls) -> None:
@@ -276,26 +315,34 @@ class OBIProtocol:
         if cls._initialized:
             return
         
-        result = _lib.obi_init()
-        if result != OBIResult.SUCCESS:
-            raise OBIException(OBIResult(result), "Failed to initialize OBI protocol")
-        
-        cls._initialized = True
+        # Double-checked so concurrent first use calls obi_init exactly once
+        with cls._init_lock:
+            if cls._initialized:
+                return
+            
+            result = _lib.obi_init()
+            if result != _SUCCESS:
+                raise OBIException(OBIResult(result), "Failed to initialize OBI protocol")
+            
+            cls._initialized = True
     
     @classmethod
     def cleanup(cls) -> None:
         """Cleanup OBI protocol"""
-        if cls._initialized:
-            _lib.obi_cleanup()
-            cls._initialized = False
+        with cls._init_lock:
+            if cls._initialized:
+                _lib.obi_cleanup()
+                cls._initialized = False
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_version() -> str:
         """Get OBI protocol version"""
         version_bytes = _lib.obi_get_version_string()
         return version_bytes.decode('utf-8') if version_bytes else "Unknown"
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_zero_trust_enforced() -> bool:
         """Check if Zero Trust is enforced"""
         return bool(_lib.obi_is_zero_trust_enforced())
@@ -309,32 +356,57 @@ class OBIProtocol:
     def create_validator(context: Optional[ValidationContext] = None) -> OBIValidator:
         """Create new OBI validator"""
         return OBIValidator(context)
+    
+    @classmethod
+    def serialize_many(cls, messages: List[Any],
+                       context: Optional[ValidationContext] = None) -> List[bytes]:
+        """
+        Secure serialization of a batch of messages
+        
+        One validator is shared by the whole batch; every message gets a
+        fresh buffer and is validated by the C core. Errors are raised
+        as in serialize_secure
+        """
+        if not messages:
+            return []
+        
+        cls.initialize()
+        
+        encoded = [_canonical_bytes(message) for message in messages]
+        validator = cls.create_validator(context)
+        
+        for index, data_bytes in enumerate(encoded):
+            # A validated buffer keeps its C-side flags, so it is never reused
+            buffer = OBIBuffer()
+            buffer.set_data(data_bytes)
+            try:
+                validator.validate(buffer)
+            except OBIException as e:
+                raise ValueError(f"Serialization failed for message {index}: {e.message}")
+        
+        return encoded
 
 def serialize_secure(data: Any, context: Optional[ValidationContext] = None) -> bytes:
     """
     Secure serialization using OBI protocol
     
     Zero Trust: All serialization goes through C core validation
+    bytes-like input is treated as already canonical and validated as-is
     """
     OBIProtocol.initialize()
     
-    # Convert data to string representation (simple serialization)
-    if isinstance(data, (dict, list)):
-        import json
-        data_str = json.dumps(data, sort_keys=True)
-    else:
-        data_str = str(data)
+    data_bytes = _canonical_bytes(data)
     
     # Create buffer and set data
     buffer = OBIProtocol.create_buffer()
-    buffer.set_data(data_str)
+    buffer.set_data(data_bytes)
     
     # Validate through Zero Trust pipeline
     validator = OBIProtocol.create_validator(context)
     
     try:
         validator.validate(buffer)
-        return data_str.encode('utf-8')
+        return data_bytes
     except OBIException as e:
         raise ValueError(f"Serialization failed: {e.message}")
 